@@ -12,7 +12,6 @@ from homeassistant.helpers.typing import ConfigType
 from . import assets
 from .const import DOMAIN, PLATFORMS, USER_ID
 from .coordinator import TechCoordinator
-from .tech import Tech
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,14 +26,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # pylin
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Tech Controllers from a config entry."""
     _LOGGER.debug("Setting up component's entry")
-    _LOGGER.debug("Entry id: %s", str(entry.entry_id))
-    _LOGGER.debug(
-        "Entry -> title: %s, data: %s, id: %s, domain: %s",
-        entry.title,
-        assets.redact(dict(entry.data), ["token"]),
-        entry.entry_id,
-        entry.domain,
-    )
+    _LOGGER.debug("Entry id: %s", entry.entry_id)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Entry -> title: %s, data: %s, id: %s, domain: %s",
+            entry.title,
+            assets.redact(dict(entry.data), ["token"]),
+            entry.entry_id,
+            entry.domain,
+        )
     language_code = hass.config.language
     user_id = entry.data[USER_ID]
     token = entry.data[CONF_TOKEN]
@@ -47,7 +47,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await coordinator.async_config_entry_first_refresh()
 
-    await assets.load_subtitles(language_code, Tech(websession, user_id, token))
+    await assets.load_subtitles(language_code, coordinator.api)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -260,3 +260,7 @@ class TechThermostat(ClimateEntity, CoordinatorEntity):
             await self._coordinator.api.set_zone(self._udid, self._id, False)
         elif hvac_mode == HVACMode.HEAT:
             await self._coordinator.api.set_zone(self._udid, self._id, True)
+        # Show the new zone state without waiting for the next poll. The
+        # coordinator runs the first refresh request right away and folds any
+        # further requests made during its cooldown into one more fetch.
+        await self.coordinator.async_request_refresh()
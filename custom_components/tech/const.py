@@ -30,6 +30,7 @@ DEFAULT_ICON = "mdi:eye"
 PLATFORMS = [Platform.BINARY_SENSOR, Platform.CLIMATE, Platform.SENSOR]
 
 SCAN_INTERVAL: Final = timedelta(seconds=60)
+MAX_SCAN_INTERVAL: Final = timedelta(seconds=300)
 API_TIMEOUT: Final = 60
 
 # tile type
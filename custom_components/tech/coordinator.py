@@ -1,9 +1,11 @@
 """Ruckus DataUpdateCoordinator."""
 
 import asyncio
+from datetime import timedelta
 import logging
 
 from aiohttp import ClientSession
+import orjson
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
@@ -11,7 +13,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import API_TIMEOUT, CONTROLLER, DOMAIN, SCAN_INTERVAL, UDID
+from .const import (
+    API_TIMEOUT,
+    CONTROLLER,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    SCAN_INTERVAL,
+    UDID,
+)
 from .tech import Tech, TechError, TechLoginError
 
 _LOGGER = logging.getLogger(__package__)
@@ -23,7 +32,13 @@ class TechCoordinator(DataUpdateCoordinator):
     config_entry: ConfigEntry
 
     def __init__(
-        self, hass: HomeAssistant, session: ClientSession, user_id: str, token: str
+        self,
+        hass: HomeAssistant,
+        session: ClientSession,
+        user_id: str,
+        token: str,
+        min_interval: timedelta = SCAN_INTERVAL,
+        max_interval: timedelta = MAX_SCAN_INTERVAL,
     ) -> None:
         """Initialize my coordinator."""
         super().__init__(
@@ -32,23 +47,50 @@ class TechCoordinator(DataUpdateCoordinator):
             # Name of the data. For logging purposes.
             name=DOMAIN,
             # Polling interval. Will only be polled if there are subscribers.
-            update_interval=SCAN_INTERVAL,
+            update_interval=min_interval,
         )
         self.api = Tech(session, user_id, token)
+        self._udid = self.config_entry.data[CONTROLLER][UDID]
+        self._controller_name = self.config_entry.data[CONTROLLER][CONF_NAME]
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._content_hash: int | None = None
 
     async def _async_update_data(self) -> dict:
         """Fetch data from TECH API endpoint(s)."""
 
-        _LOGGER.debug(
-            "Updating data for: %s", str(self.config_entry.data[CONTROLLER][CONF_NAME])
-        )
+        _LOGGER.debug("Updating data for: %s", self._controller_name)
 
         try:
             async with asyncio.timeout(API_TIMEOUT):
-                return await self.api.module_data(
-                    self.config_entry.data[CONTROLLER][UDID]
-                )
+                data = await self.api.module_data(self._udid)
         except TechLoginError as err:
             raise ConfigEntryAuthFailed from err
         except TechError as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        self._adapt_update_interval(data)
+        return data
+
+    def _adapt_update_interval(self, data: dict) -> None:
+        """Adjust the polling interval to how often the module data changes.
+
+        The interval grows by half while consecutive polls return the same
+        zones and tiles, and is halved as soon as a change is observed. It is
+        always kept between the configured minimum and maximum interval.
+        """
+        content_hash = hash(
+            orjson.dumps((data["zones"], data["tiles"]), option=orjson.OPT_NON_STR_KEYS)
+        )
+        interval = self.update_interval or self._min_interval
+        if content_hash == self._content_hash:
+            interval = min(self._max_interval, interval * 1.5)
+        else:
+            interval = max(self._min_interval, interval / 2)
+        self._content_hash = content_hash
+
+        if interval != self.update_interval:
+            _LOGGER.debug(
+                "Changing update interval for %s to %s", self._controller_name, interval
+            )
+            self.update_interval = interval
@@ -1,5 +1,6 @@
 """Support for Tech HVAC system."""
 
+import asyncio
 import itertools
 import logging
 from typing import Any, cast
@@ -80,15 +81,15 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up entry."""
-    _LOGGER.debug(
-        "Setting up sensor entry, controller udid: %s",
-        config_entry.data[CONTROLLER][UDID],
-    )
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
     controller_udid = config_entry.data[CONTROLLER][UDID]
+    _LOGGER.debug("Setting up sensor entry, controller udid: %s", controller_udid)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    zones = await coordinator.api.get_module_zones(controller_udid)
-    tiles = await coordinator.api.get_module_tiles(controller_udid)
+    # Fetched together, so both are served by a single module data request.
+    zones, tiles = await asyncio.gather(
+        coordinator.api.get_module_zones(controller_udid),
+        coordinator.api.get_module_tiles(controller_udid),
+    )
 
     entities = []
     for t in tiles:
@@ -492,11 +493,10 @@ class TechBatterySensor(CoordinatorEntity, SensorEntity):
         _LOGGER.debug("Init TechBatterySensor... ")
         super().__init__(coordinator)
         self._config_entry = config_entry
+        udid = config_entry.data[CONTROLLER][UDID]
         self._coordinator = coordinator
         self._id = device[CONF_ZONE][CONF_ID]
-        self._unique_id = (
-            config_entry.data[CONTROLLER][UDID] + "_" + str(device[CONF_ZONE][CONF_ID])
-        )
+        self._unique_id = udid + "_" + str(device[CONF_ZONE][CONF_ID])
         self._device_name = device[CONF_DESCRIPTION][CONF_NAME]
         self._model = (
             config_entry.data[CONTROLLER][CONF_NAME]
@@ -573,11 +573,10 @@ class TechTemperatureSensor(CoordinatorEntity, SensorEntity):
         _LOGGER.debug("Init TechTemperatureSensor... ")
         super().__init__(coordinator)
         self._config_entry = config_entry
+        udid = config_entry.data[CONTROLLER][UDID]
         self._coordinator = coordinator
         self._id = device[CONF_ZONE][CONF_ID]
-        self._unique_id = (
-            config_entry.data[CONTROLLER][UDID] + "_" + str(device[CONF_ZONE][CONF_ID])
-        )
+        self._unique_id = udid + "_" + str(device[CONF_ZONE][CONF_ID])
         self._device_name = device[CONF_DESCRIPTION][CONF_NAME]
         self._model = (
             config_entry.data[CONTROLLER][CONF_NAME]
@@ -660,11 +659,10 @@ class TechOutsideTempTile(CoordinatorEntity, SensorEntity):
         _LOGGER.debug("Init TechOutsideTemperatureTile... ")
         super().__init__(coordinator)
         self._config_entry = config_entry
+        udid = config_entry.data[CONTROLLER][UDID]
         self._coordinator = coordinator
         self._id = device[CONF_ID]
-        self._unique_id = (
-            config_entry.data[CONTROLLER][UDID] + "_" + str(device[CONF_ZONE][CONF_ID])
-        )
+        self._unique_id = udid + "_" + str(device[CONF_ZONE][CONF_ID])
         self._device_name = device[CONF_DESCRIPTION][CONF_NAME]
         self._model = (
             config_entry.data[CONTROLLER][CONF_NAME]
@@ -676,7 +674,7 @@ class TechOutsideTempTile(CoordinatorEntity, SensorEntity):
         _LOGGER.debug(
             "Init TechOutsideTemperatureTile...: %s, udid: %s, id: %s",
             self._name,
-            self._config_entry.data[CONTROLLER][UDID],
+            udid,
             self._id,
         )
 
@@ -754,11 +752,10 @@ class TechHumiditySensor(CoordinatorEntity, SensorEntity):
         _LOGGER.debug("Init TechHumiditySensor... ")
         super().__init__(coordinator)
         self._config_entry = config_entry
+        udid = config_entry.data[CONTROLLER][UDID]
         self._coordinator = coordinator
         self._id = device[CONF_ZONE][CONF_ID]
-        self._unique_id = (
-            config_entry.data[CONTROLLER][UDID] + "_" + str(device[CONF_ZONE][CONF_ID])
-        )
+        self._unique_id = udid + "_" + str(device[CONF_ZONE][CONF_ID])
         self._device_name = device[CONF_DESCRIPTION][CONF_NAME]
         self._model = (
             config_entry.data[CONTROLLER][CONF_NAME]
@@ -839,11 +836,10 @@ class ZoneSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
+        udid = config_entry.data[CONTROLLER][UDID]
         self._coordinator = coordinator
         self._id = device[CONF_ZONE][CONF_ID]
-        self._unique_id = (
-            config_entry.data[CONTROLLER][UDID] + "_" + str(device[CONF_ZONE][CONF_ID])
-        )
+        self._unique_id = udid + "_" + str(device[CONF_ZONE][CONF_ID])
         self._device_name = (
             device[CONF_DESCRIPTION][CONF_NAME]
             if not self._config_entry.data[INCLUDE_HUB_IN_NAME]
@@ -1,17 +1,65 @@
 """Python wrapper for getting interaction with Tech devices."""
 
 import asyncio
-import json
 import logging
 import time
+from types import MappingProxyType
 
 import aiohttp
+import orjson
 
 from .const import TECH_SUPPORTED_LANGUAGES
 
-logging.basicConfig(level=logging.DEBUG)
 _LOGGER = logging.getLogger(__name__)
 
+# Request bodies of the zone mutations have a fixed shape, so they are
+# formatted straight into bytes instead of serializing a new dict every call.
+CONST_TEMP_PAYLOAD = (
+    b'{"mode":{"id":%d,"parentId":%d,"mode":"constantTemp",'
+    b'"constTempTime":60,"setTemperature":%d,"scheduleIndex":0}}'
+)
+ZONE_ON_PAYLOAD = b'{"zone":{"id":%d,"zoneState":"zoneOn"}}'
+ZONE_OFF_PAYLOAD = b'{"zone":{"id":%d,"zoneState":"zoneOff"}}'
+
+# Only the beginning of an error response is kept, so a large HTML error page
+# is not read and decoded in full.
+MAX_ERROR_BODY = 2048
+
+
+async def _read_error_body(response):
+    """Return the beginning of an error response body as text.
+
+    Args:
+    response (aiohttp.ClientResponse): The failed response.
+
+    Returns:
+    str: At most MAX_ERROR_BODY bytes of the body, decoded leniently.
+
+    """
+    # A single read only returns what is buffered so far, so keep reading
+    # until enough of the body has arrived or it has ended.
+    body = bytearray()
+    while len(body) < MAX_ERROR_BODY and not response.content.at_eof():
+        chunk = await response.content.read(MAX_ERROR_BODY - len(body))
+        if not chunk:
+            break
+        body += chunk
+    return body[:MAX_ERROR_BODY].decode("utf-8", "replace")
+
+
+def _retrieve_exception(request):
+    """Mark the exception of a finished shared request as retrieved.
+
+    Every caller awaiting the request may have been cancelled by the time it
+    fails, and asyncio would then log the exception as never retrieved.
+
+    Args:
+    request (asyncio.Future): The finished request.
+
+    """
+    if not request.cancelled():
+        request.exception()
+
 
 class Tech:
     """Main class to perform Tech API requests."""
@@ -35,23 +83,44 @@ class Tech:
 
         """
         _LOGGER.debug("Init Tech")
-        self.headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+        self._headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+        self._post_headers = {**self._headers, "Content-Type": "application/json"}
+        # Headers are built once and shared by every request; the read-only
+        # views make sure no caller mutates them by accident.
+        self.headers = MappingProxyType(self._headers)
+        self.post_headers = MappingProxyType(self._post_headers)
         self.base_url = base_url
         self.session = session
         if user_id and token:
             self.user_id = user_id
             self.token = token
-            self.headers.setdefault("Authorization", f"Bearer {token}")
+            self._set_authorization(token)
             self.authenticated = True
         else:
             self.authenticated = False
         self.last_update = None
-        self.update_lock = asyncio.Lock()
         self.modules = {}
+        self._module_data_requests: dict[str, asyncio.Future] = {}
+        self._etag_cache: dict[str, tuple[str, dict]] = {}
+
+    def _set_authorization(self, token):
+        """Store the bearer token in the GET and POST request headers.
+
+        Args:
+        token (str): The authentication token.
+
+        """
+        bearer = f"Bearer {token}"
+        self._headers["Authorization"] = bearer
+        self._post_headers["Authorization"] = bearer
 
     async def get(self, request_path):
         """Perform a GET request to the specified request path.
 
+        If the API returned an ETag for the previous response of the same path,
+        the request is made conditional and the cached data is returned when
+        the API answers with 304 Not Modified.
+
         Args:
         request_path (str): The path to send the GET request to.
 
@@ -59,24 +128,36 @@ class Tech:
         dict: The JSON response data.
 
         Raises:
-        TechError: If the response status is not 200.
+        TechError: If the response status is not 200, or is 304 while no
+        data is cached for the path.
 
         """
         url = self.base_url + request_path
         _LOGGER.debug("Sending GET request: %s", url)
-        async with self.session.get(url, headers=self.headers) as response:
+        headers = self.headers
+        cached = self._etag_cache.get(request_path)
+        if cached is not None:
+            headers = {**self.headers, "If-None-Match": cached[0]}
+        async with self.session.get(url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                _LOGGER.debug("Not modified: %s", url)
+                return cached[1]
             if response.status != 200:
                 _LOGGER.warning("Invalid response from Tech API: %s", response.status)
-                raise TechError(response.status, await response.text())
+                raise TechError(response.status, await _read_error_body(response))
 
-            return await response.json()
+            result = orjson.loads(await response.read())
+            etag = response.headers.get("ETag")
+            if etag is not None:
+                self._etag_cache[request_path] = (etag, result)
+            return result
 
     async def post(self, request_path, post_data):
         """Send a POST request to the specified URL with the given data.
 
         Args:
         request_path: The path for the request.
-        post_data: The data to be sent with the request.
+        post_data: The JSON encoded data to be sent with the request.
 
         Returns:
         The JSON response from the request.
@@ -88,13 +169,15 @@ class Tech:
         url = self.base_url + request_path
         _LOGGER.debug("Sending POST request: %s", url)
         async with self.session.post(
-            url, data=post_data, headers=self.headers
+            url,
+            data=post_data,
+            headers=self.post_headers,
         ) as response:
             if response.status != 200:
                 _LOGGER.warning("Invalid response from Tech API: %s", response.status)
-                raise TechError(response.status, await response.text())
+                raise TechError(response.status, await _read_error_body(response))
 
-            return await response.json()
+            return orjson.loads(await response.read())
 
     async def authenticate(self, username, password):
         """Authenticate the user with the given username and password.
@@ -108,18 +191,14 @@ class Tech:
 
         """
         path = "authentication"
-        post_data = json.dumps({"username": username, "password": password})
+        post_data = orjson.dumps({"username": username, "password": password})
         try:
             result = await self.post(path, post_data)
             self.authenticated = result["authenticated"]
             if self.authenticated:
                 self.user_id = str(result["user_id"])
                 self.token = result["token"]
-                self.headers = {
-                    "Accept": "application/json",
-                    "Accept-Encoding": "gzip",
-                    "Authorization": f"Bearer {self.token}",
-                }
+                self._set_authorization(self.token)
         except TechError as err:
             raise TechLoginError(401, "Unauthorized") from err
         return result["authenticated"]
@@ -159,12 +238,23 @@ class Tech:
 
         """
         _LOGGER.debug("Getting module data...  %s", module_udid)
-        if self.authenticated:
-            path = f"users/{self.user_id}/modules/{module_udid}"
-            result = await self.get(path)
-        else:
+        if not self.authenticated:
             raise TechError(401, "Unauthorized")
-        return result
+
+        # Concurrent callers (e.g. platforms being set up at the same time)
+        # share a single in-flight request instead of each fetching the module.
+        request = self._module_data_requests.get(module_udid)
+        if request is None:
+            path = f"users/{self.user_id}/modules/{module_udid}"
+            request = asyncio.ensure_future(self.get(path))
+            self._module_data_requests[module_udid] = request
+            request.add_done_callback(
+                lambda _: self._module_data_requests.pop(module_udid, None)
+            )
+            request.add_done_callback(_retrieve_exception)
+        # Shield the shared request, so a caller timing out does not cancel it
+        # for everybody else waiting on the same response.
+        return await asyncio.shield(request)
 
     async def get_translations(self, language):
         """Retrieve language pack for a given language.
@@ -213,20 +303,16 @@ class Tech:
 
         _LOGGER.debug("Updating module zones ... %s", module_udid)
         result = await self.get_module_data(module_udid)
-        zones = result["zones"]["elements"]
-        zones = list(
-            filter(
-                lambda e: e is not None
-                and "zone" in e
-                and e["zone"] is not None
-                and "visibility" in e["zone"],
-                zones,
-            )
+        self.modules[module_udid]["zones"].update(
+            {
+                zone["zone"]["id"]: zone
+                for zone in result["zones"]["elements"]
+                if zone is not None
+                and zone.get("zone") is not None
+                and "visibility" in zone["zone"]
+            }
         )
 
-        for zone in zones:
-            self.modules[module_udid]["zones"][zone["zone"]["id"]] = zone
-
         return self.modules[module_udid]["zones"]
 
     async def get_module_tiles(self, module_udid):
@@ -245,11 +331,9 @@ class Tech:
 
         _LOGGER.debug("Updating module tiles ... %s", module_udid)
         result = await self.get_module_data(module_udid)
-        tiles = result["tiles"]
-        tiles = list(filter(lambda e: e["visibility"], tiles))
-
-        for tile in tiles:
-            self.modules[module_udid]["tiles"][tile["id"]] = tile
+        self.modules[module_udid]["tiles"].update(
+            {tile["id"]: tile for tile in result["tiles"] if tile["visibility"]}
+        )
 
         return self.modules[module_udid]["tiles"]
 
@@ -275,38 +359,24 @@ class Tech:
 
         _LOGGER.debug("Updating module zones & tiles ... %s", module_udid)
         result = await self.get_module_data(module_udid)
-        zones = result["zones"]["elements"]
-        zones = list(
-            filter(
-                lambda e: e is not None
-                and "zone" in e
-                and e["zone"] is not None
-                and "visibility" in e["zone"],
-                zones,
-            )
-        )
-
-        if len(zones) > 0:
+        zones = {
+            zone["zone"]["id"]: zone
+            for zone in result["zones"]["elements"]
+            if zone is not None
+            and zone.get("zone") is not None
+            and "visibility" in zone["zone"]
+            and zone["zone"].get("zoneState", "zoneUnregistered") != "zoneUnregistered"
+        }
+
+        if zones:
             _LOGGER.debug("Updating zones for controller: %s", module_udid)
-            zones = list(
-                filter(
-                    lambda e: e is not None
-                    and "zone" in e
-                    and e["zone"] is not None
-                    and "zoneState" in e["zone"]
-                    and e["zone"]["zoneState"] != "zoneUnregistered",
-                    zones,
-                )
-            )
-            for zone in zones:
-                self.modules[module_udid]["zones"][zone["zone"]["id"]] = zone
-        tiles = result["tiles"]
-        tiles = list(filter(lambda e: e["visibility"], tiles))
+            self.modules[module_udid]["zones"].update(zones)
+
+        tiles = {tile["id"]: tile for tile in result["tiles"] if tile["visibility"]}
 
-        if len(tiles) > 0:
+        if tiles:
             _LOGGER.debug("Updating tiles for controller: %s", module_udid)
-            for tile in tiles:
-                self.modules[module_udid]["tiles"][tile["id"]] = tile
+            self.modules[module_udid]["tiles"].update(tiles)
         self.modules[module_udid]["last_update"] = now
         return self.modules[module_udid]
 
@@ -353,19 +423,14 @@ class Tech:
         _LOGGER.debug("Setting zone constant temperature…")
         if self.authenticated:
             path = f"users/{self.user_id}/modules/{module_udid}/zones"
-            data = {
-                "mode": {
-                    "id": self.modules[module_udid]["zones"][zone_id]["mode"]["id"],
-                    "parentId": zone_id,
-                    "mode": "constantTemp",
-                    "constTempTime": 60,
-                    "setTemperature": int(target_temp * 10),
-                    "scheduleIndex": 0,
-                }
-            }
-            _LOGGER.debug(data)
-            result = await self.post(path, json.dumps(data))
-            _LOGGER.debug(result)
+            data = CONST_TEMP_PAYLOAD % (
+                self.modules[module_udid]["zones"][zone_id]["mode"]["id"],
+                zone_id,
+                int(target_temp * 10),
+            )
+            _LOGGER.debug("Request data: %s", data)
+            result = await self.post(path, data)
+            _LOGGER.debug("Response: %s", result)
         else:
             raise TechError(401, "Unauthorized")
         return result
@@ -385,10 +450,10 @@ class Tech:
         _LOGGER.debug("Turing zone on/off: %s", on)
         if self.authenticated:
             path = f"users/{self.user_id}/modules/{module_udid}/zones"
-            data = {"zone": {"id": zone_id, "zoneState": "zoneOn" if on else "zoneOff"}}
-            _LOGGER.debug(data)
-            result = await self.post(path, json.dumps(data))
-            _LOGGER.debug(result)
+            data = (ZONE_ON_PAYLOAD if on else ZONE_OFF_PAYLOAD) % zone_id
+            _LOGGER.debug("Request data: %s", data)
+            result = await self.post(path, data)
+            _LOGGER.debug("Response: %s", result)
         else:
             raise TechError(401, "Unauthorized")
         return result
@@ -1,13 +1,33 @@
 """Common helpers."""
 
+import functools
 import pathlib
 
 
 def load_fixture(filename: str, integration: str | None = None) -> str:
     """Load a fixture."""
-    return get_fixture_path(filename, integration).read_text()
+    return _read_fixture(filename, integration).decode()
 
 
+@functools.cache
+def _read_fixture(filename: str, integration: str | None = None) -> bytes:
+    """Read a fixture once and cache its raw contents."""
+    return get_fixture_path(filename, integration).read_bytes()
+
+
+@functools.cache
 def get_fixture_path(filename: str, integration: str | None = None) -> pathlib.Path:
     """Get path of fixture."""
     return pathlib.Path(__file__).parent.joinpath("fixtures", filename)
+
+
+def register_module(tech, module_udid: str):
+    """Register an empty module entry on a Tech instance and return the instance.
+
+    The zone and tile readers update the entry of an already known module, so
+    it has to exist before they are called. An existing entry is kept.
+    """
+    tech.modules.setdefault(
+        module_udid, {"last_update": None, "zones": {}, "tiles": {}}
+    )
+    return tech
@@ -0,0 +1,97 @@
+"""Test the adaptive polling interval of the Tech coordinator."""
+
+from collections.abc import Generator
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.tech.const import CONTROLLER, UDID
+from custom_components.tech.coordinator import TechCoordinator
+from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
+
+MODULE_UDID = "123456789"
+MIN_INTERVAL = timedelta(minutes=2)
+MAX_INTERVAL = timedelta(minutes=5)
+
+DATA = {"zones": {1: {"temperature": 215}}, "tiles": {}}
+CHANGED_DATA = {"zones": {1: {"temperature": 220}}, "tiles": {}}
+
+
+@pytest.fixture(name="coordinator")
+def coordinator_fixture() -> Generator[TechCoordinator]:
+    """Yield a coordinator for a stub config entry with the module data mocked.
+
+    The coordinator reads its config entry from the context Home Assistant
+    sets while setting up an entry, so the stub entry is set there.
+    """
+    config_entry = Mock(
+        data={CONTROLLER: {UDID: MODULE_UDID, CONF_NAME: "Test controller"}}
+    )
+    token = config_entries.current_entry.set(config_entry)
+    try:
+        coordinator = TechCoordinator(
+            Mock(),
+            Mock(),
+            "user123",
+            "token",
+            min_interval=MIN_INTERVAL,
+            max_interval=MAX_INTERVAL,
+        )
+    finally:
+        config_entries.current_entry.reset(token)
+    coordinator.api.module_data = AsyncMock(return_value=DATA)
+    yield coordinator
+
+
+async def poll(coordinator: TechCoordinator, data: dict, times: int = 1) -> None:
+    """Run the given number of updates, each returning the given module data."""
+    coordinator.api.module_data.return_value = data
+    for _ in range(times):
+        assert await coordinator._async_update_data() is data
+
+
+class TestAdaptUpdateInterval:
+    """Test cases for the polling interval adapted by TechCoordinator updates."""
+
+    async def test_starts_at_min_interval(self, coordinator):
+        """Test that polling starts at the configured minimum interval."""
+        assert coordinator.update_interval == MIN_INTERVAL
+
+        await poll(coordinator, DATA)
+
+        coordinator.api.module_data.assert_awaited_once_with(MODULE_UDID)
+        assert coordinator.update_interval == MIN_INTERVAL
+
+    async def test_grows_while_unchanged(self, coordinator):
+        """Test that the interval grows by half while the data is unchanged."""
+        await poll(coordinator, DATA, times=2)
+        assert coordinator.update_interval == timedelta(minutes=3)
+
+        await poll(coordinator, DATA)
+        assert coordinator.update_interval == timedelta(minutes=4.5)
+
+    async def test_clamped_to_max_interval(self, coordinator):
+        """Test that the interval never exceeds the maximum interval."""
+        await poll(coordinator, DATA, times=10)
+
+        assert coordinator.update_interval == MAX_INTERVAL
+
+    async def test_shrinks_on_change(self, coordinator):
+        """Test that the interval is halved as soon as the data changes."""
+        await poll(coordinator, DATA, times=10)
+
+        await poll(coordinator, CHANGED_DATA)
+
+        assert coordinator.update_interval == MAX_INTERVAL / 2
+
+    async def test_clamped_to_min_interval(self, coordinator):
+        """Test that the interval never drops below the minimum interval."""
+        await poll(coordinator, DATA, times=10)
+
+        await poll(coordinator, CHANGED_DATA)
+        await poll(coordinator, DATA)
+        await poll(coordinator, CHANGED_DATA)
+
+        assert coordinator.update_interval == MIN_INTERVAL
@@ -1,16 +1,20 @@
 """pytest fixtures."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 import json
+from unittest.mock import AsyncMock
 
 import aiohttp
+from aioresponses import aioresponses
 import pytest
+import pytest_asyncio
 
 from custom_components.tech.const import DOMAIN
-from tests.common import load_fixture
+from custom_components.tech.tech import Tech
+from tests.common import load_fixture, register_module
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def valid_credentials():
     """Fixture to provide valid credentials."""
     yield {
@@ -27,7 +31,7 @@ def invalid_credentials():
     yield {"username": "test_wrong", "password": "test_wrong"}
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def module_data():
     """Fixture to provide module data."""
     yield {
@@ -48,16 +52,124 @@ def mock_set_const_temp_response_fixture() -> dict:
     return json.loads(load_fixture("set_constant_temp.json", DOMAIN))
 
 
-@pytest.fixture(
+@pytest.fixture(name="tech")
+def tech_fixture(client_session: aiohttp.ClientSession) -> Tech:
+    """Return a fresh, unauthenticated Tech instance."""
+    return Tech(client_session)
+
+
+@pytest.fixture(name="token_tech")
+def token_tech_fixture(
+    client_session: aiohttp.ClientSession, valid_credentials: dict
+) -> Tech:
+    """Return a Tech instance authenticated with the stored demo token.
+
+    No login request is made, so the instance can be used against mocked
+    responses.
+    """
+    return Tech(
+        client_session, valid_credentials["user_id"], valid_credentials["token"]
+    )
+
+
+@pytest.fixture(name="primed_tech", scope="class")
+def primed_tech_fixture(client_session: aiohttp.ClientSession) -> Tech:
+    """Return an authenticated Tech instance with a known module for mocked tests.
+
+    The instance is shared by the tests of a class, so they must only read its
+    state; Tech.post is patched per test.
+    """
+    tech = Tech(client_session)
+    tech.authenticated = True
+    tech.user_id = "user123"
+    tech.modules = {"123456789": {"zones": {1: {"mode": {"id": 123}}}}}
+    return tech
+
+
+@pytest.fixture(name="mock_tech_post")
+def mock_tech_post_fixture(
+    monkeypatch: pytest.MonkeyPatch, mock_set_const_temp_response: dict
+) -> AsyncMock:
+    """Replace Tech.post for the whole test and return the mock."""
+    mock_post = AsyncMock(return_value=mock_set_const_temp_response)
+    monkeypatch.setattr(Tech, "post", mock_post)
+    return mock_post
+
+
+@pytest.fixture(name="mock_api")
+def mock_api_fixture() -> Generator[aioresponses]:
+    """Yield an aioresponses instance intercepting all aiohttp requests."""
+    with aioresponses() as mocked:
+        yield mocked
+
+
+@pytest_asyncio.fixture(
     name="client_session",
     # Use an auto-use fixture to make the session available in tests.
-    # The session is yielded and closed by the fixture.
+    # The session is shared by the whole test session, so its connection pool
+    # is reused between tests, and closed by the fixture at the end.
     autouse=True,
+    scope="session",
+    loop_scope="session",
 )
 async def client_session_fixture() -> AsyncGenerator:
-    """Yield a client session for use in aiohttp tests."""
-    session = aiohttp.ClientSession()
+    """Yield a client session shared by all aiohttp tests."""
+    # Resolve through aiodns (a Home Assistant dependency) and cache the API
+    # host lookup for the whole run. Idle connections are kept long enough to
+    # be reused by the next test, and concurrent tests get their own ones.
+    connector = aiohttp.TCPConnector(
+        resolver=aiohttp.AsyncResolver(),
+        ttl_dns_cache=600,
+        limit_per_host=20,
+        keepalive_timeout=75,
+    )
+    # Fail fast on network trouble instead of the default 5 minute timeout.
+    timeout = aiohttp.ClientTimeout(total=10, connect=3)
+    session = aiohttp.ClientSession(connector=connector, timeout=timeout)
     try:
         yield session
     finally:
         await session.close()
+
+
+@pytest_asyncio.fixture(
+    name="authenticated_tech",
+    scope="session",
+    loop_scope="session",
+)
+async def authenticated_tech_fixture(
+    client_session: aiohttp.ClientSession, valid_credentials: dict
+) -> Tech:
+    """Return a Tech instance authenticated once for the whole test session.
+
+    Only share it with tests that do not change its state; tests flipping
+    the authentication need their own instance.
+    """
+    tech = Tech(client_session)
+    authenticated = await tech.authenticate(
+        valid_credentials["username"], valid_credentials["password"]
+    )
+    assert authenticated, "Authentication should be successful"
+    return tech
+
+
+@pytest_asyncio.fixture(
+    name="cached_module_data",
+    scope="session",
+    loop_scope="session",
+)
+async def cached_module_data_fixture(
+    authenticated_tech: Tech, module_data: dict
+) -> dict:
+    """Return the demo module data, fetched once for the whole test session.
+
+    Fetching it also populates authenticated_tech.modules, which the set_*
+    tests rely on.
+    """
+    return await authenticated_tech.module_data(module_data["module_id"])
+
+
+@pytest.fixture(name="tech_with_module")
+def tech_with_module_fixture(authenticated_tech: Tech, module_data: dict) -> Tech:
+    """Return the authenticated Tech instance with the demo module registered."""
+    return register_module(authenticated_tech, module_data["module_id"])
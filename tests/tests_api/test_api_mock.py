@@ -0,0 +1,479 @@
+"""Test Tech API against mocked responses.
+
+These tests check the behaviour of the Tech client itself, so the API is
+served from recorded fixtures instead of the live demo account.
+
+"""
+
+import asyncio
+import gc
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from custom_components.tech.const import DOMAIN
+from custom_components.tech.tech import (
+    MAX_ERROR_BODY,
+    Tech,
+    TechError,
+    _read_error_body,
+)
+from tests.common import load_fixture, register_module
+
+# Run on the session event loop, which the shared client session is bound to.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+API_URL = Tech.TECH_API_URL
+
+# Module and zone the primed_tech fixture is set up with.
+MODULE_UDID = "123456789"
+ZONE_ID = 1
+ZONES_PATH = f"users/user123/modules/{MODULE_UDID}/zones"
+
+# Request bodies as sent on the wire: compact JSON with a fixed key order.
+EXPECTED_CONST_TEMP = (
+    b'{"mode":{"id":123,"parentId":1,"mode":"constantTemp",'
+    b'"constTempTime":60,"setTemperature":225,"scheduleIndex":0}}'
+)
+EXPECTED_ZONE_ON = b'{"zone":{"id":1,"zoneState":"zoneOn"}}'
+EXPECTED_ZONE_OFF = b'{"zone":{"id":1,"zoneState":"zoneOff"}}'
+
+
+class TestTechAPIMock:
+    """Test cases for TECH API with mocked responses."""
+
+    async def test_authenticate(
+        self,
+        tech: Tech,
+        mock_api: aioresponses,
+        valid_credentials: dict,
+    ) -> None:
+        """Test that authenticate() stores the user ID and token.
+
+        Args:
+            tech (Tech): Pytest fixture with an unauthenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+            valid_credentials (dict): Pytest fixture with valid credentials.
+
+        """
+        mock_api.post(
+            API_URL + "authentication",
+            body=load_fixture("auth.json", DOMAIN),
+        )
+        authenticated: bool = await tech.authenticate(
+            valid_credentials["username"], valid_credentials["password"]
+        )
+        assert authenticated, "Authentication should be successful"
+        assert tech.user_id == str(valid_credentials["user_id"]), "Unexpected user ID"
+        assert tech.headers["Authorization"] == f"Bearer {tech.token}"
+
+    async def test_list_modules(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+    ) -> None:
+        """Test that list_modules() returns the list of modules.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+
+        """
+        user_id = token_tech.user_id
+        mock_api.get(
+            f"{API_URL}users/{user_id}/modules",
+            body=load_fixture("get_modules.json", DOMAIN),
+        )
+
+        modules: list = await token_tech.list_modules()
+        assert isinstance(modules, list), "We should receive a list of modules"
+        assert modules[0]["id"] == 0, "First module id should be 0"
+
+    async def test_get_module_data(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+        module_data: dict,
+    ) -> None:
+        """Test that get_module_data() returns the details of a module.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+            module_data (dict): Pytest fixture with module data.
+
+        """
+        user_id = token_tech.user_id
+        mock_api.get(
+            f"{API_URL}users/{user_id}/modules/{module_data['module_id']}",
+            body=load_fixture("get_module_data.json", DOMAIN),
+        )
+
+        module: dict = await token_tech.get_module_data(module_data["module_id"])
+        assert "zones" in module, "The module should have key 'zones'"
+        assert "tiles" in module, "The module should have key 'tiles'"
+
+    async def test_module_read_api(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+        module_data: dict,
+    ) -> None:
+        """Test that concurrent module reads return zones and tiles from one request.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+            module_data (dict): Pytest fixture with module data.
+
+        """
+        module_id: str = module_data["module_id"]
+        url = f"{API_URL}users/{token_tech.user_id}/modules/{module_id}"
+        mock_api.get(
+            url, body=load_fixture("get_module_data.json", DOMAIN), repeat=True
+        )
+        tech = register_module(token_tech, module_id)
+
+        zones, tiles, zone, tile = await asyncio.gather(
+            tech.get_module_zones(module_id),
+            tech.get_module_tiles(module_id),
+            tech.get_zone(module_id, module_data["zone_id"]),
+            tech.get_tile(module_id, module_data["tile_id"]),
+        )
+
+        assert list(zones) == list(range(101, 109)), "Unexpected zone IDs"
+        assert module_data["tile_id"] in tiles, "The module should have the tile"
+        assert zone["zone"]["id"] == module_data["zone_id"], "The ID should match"
+        assert tile["id"] == module_data["tile_id"], "The ID should match"
+        assert (
+            len(mock_api.requests[("GET", URL(url))]) == 1
+        ), "Concurrent reads should share a single request"
+
+    async def test_shared_request_failure(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+        module_data: dict,
+    ) -> None:
+        """Test that concurrent callers all get the error of the shared request.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+            module_data (dict): Pytest fixture with module data.
+
+        """
+        module_id: str = module_data["module_id"]
+        mock_api.get(
+            f"{API_URL}users/{token_tech.user_id}/modules/{module_id}",
+            status=500,
+            body='{"error":"Internal Server Error"}',
+        )
+
+        results = await asyncio.gather(
+            token_tech.get_module_data(module_id),
+            token_tech.get_module_data(module_id),
+            return_exceptions=True,
+        )
+
+        assert all(
+            isinstance(result, TechError) and result.status_code == 500
+            for result in results
+        ), "Every caller should get the TechError"
+
+    async def test_shared_request_failure_after_cancel(
+        self,
+        token_tech: Tech,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a failure nobody waits for anymore is not reported as unretrieved.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            monkeypatch (pytest.MonkeyPatch): Pytest fixture to patch Tech.get.
+
+        """
+        release = asyncio.Event()
+
+        async def failing_get(request_path: str) -> dict:
+            await release.wait()
+            raise TechError(500, "Internal Server Error")
+
+        monkeypatch.setattr(token_tech, "get", failing_get)
+
+        async def cancel_caller_then_fail() -> None:
+            caller = asyncio.ensure_future(token_tech.get_module_data(MODULE_UDID))
+            await asyncio.sleep(0)
+            request = token_tech._module_data_requests[MODULE_UDID]
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            release.set()
+            await asyncio.wait([request])
+
+        loop = asyncio.get_running_loop()
+        previous_handler = loop.get_exception_handler()
+        errors: list[dict] = []
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        try:
+            await cancel_caller_then_fail()
+            # The unretrieved exception is only reported once the request is
+            # garbage collected.
+            gc.collect()
+        finally:
+            loop.set_exception_handler(previous_handler)
+
+        assert not errors, "The failed request should not be reported"
+
+    async def test_module_data(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+        module_data: dict,
+    ) -> None:
+        """Test that module_data() stores the visible zones and tiles.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+            module_data (dict): Pytest fixture with module data.
+
+        """
+        user_id = token_tech.user_id
+        module_id: str = module_data["module_id"]
+        mock_api.get(
+            f"{API_URL}users/{user_id}/modules/{module_id}",
+            body=load_fixture("get_module_data.json", DOMAIN),
+        )
+
+        data: dict = await token_tech.module_data(module_id)
+        assert (
+            data is token_tech.modules[module_id]
+        ), "The stored data should be returned"
+        assert isinstance(data["last_update"], float), "last_update should be set"
+        assert len(data["zones"]) == 8, "All registered zones should be stored"
+        assert len(data["tiles"]) == 20, "All visible tiles should be stored"
+
+    async def test_get_module_data_failure(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+        module_data: dict,
+    ) -> None:
+        """Test that get_module_data() raises TechError with the API error.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+            module_data (dict): Pytest fixture with module data.
+
+        """
+        user_id = token_tech.user_id
+        mock_api.get(
+            f"{API_URL}users/{user_id}/modules/{module_data['wrong_module_id']}",
+            status=403,
+            body='{"error":"User has no permission to module"}',
+        )
+
+        with pytest.raises(TechError) as exception_info:
+            await token_tech.get_module_data(module_data["wrong_module_id"])
+        exception: TechError = exception_info.value
+        assert exception.status_code == 403, "Unexpected status code"
+        assert (
+            exception.status == '{"error":"User has no permission to module"}'
+        ), "Unexpected error message"
+
+    async def test_conditional_get(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+    ) -> None:
+        """Test that a 304 Not Modified response returns the cached data.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+
+        """
+        url = f"{API_URL}users/{token_tech.user_id}/modules"
+        mock_api.get(
+            url,
+            body=load_fixture("get_modules.json", DOMAIN),
+            headers={"ETag": '"modules-v1"'},
+        )
+        mock_api.get(url, status=304)
+
+        first: list = await token_tech.list_modules()
+        second: list = await token_tech.list_modules()
+
+        assert second == first, "The cached data should be returned"
+        requests = mock_api.requests[("GET", URL(url))]
+        assert "If-None-Match" not in requests[0].kwargs["headers"]
+        assert (
+            requests[1].kwargs["headers"]["If-None-Match"] == '"modules-v1"'
+        ), "The second request should be conditional"
+
+    async def test_not_modified_without_cache(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+    ) -> None:
+        """Test that a 304 response without cached data raises TechError.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+
+        """
+        mock_api.get(f"{API_URL}users/{token_tech.user_id}/modules", status=304)
+
+        with pytest.raises(TechError) as exception_info:
+            await token_tech.list_modules()
+        assert exception_info.value.status_code == 304, "Unexpected status code"
+
+    async def test_error_body_truncated(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+    ) -> None:
+        """Test that only the beginning of a large error body is kept.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+
+        """
+        mock_api.get(
+            API_URL + "i18n/en", status=500, body="x" * (MAX_ERROR_BODY + 1000)
+        )
+
+        with pytest.raises(TechError) as exception_info:
+            await token_tech.get_translations("en")
+        exception: TechError = exception_info.value
+        assert exception.status_code == 500, "Unexpected status code"
+        assert exception.status == "x" * MAX_ERROR_BODY, "Body should be truncated"
+
+    async def test_error_body_split_across_chunks(self) -> None:
+        """Test that an error body arriving in several chunks is read in full."""
+        loop = asyncio.get_running_loop()
+        content = aiohttp.StreamReader(Mock(), 2**16, loop=loop)
+        content.feed_data(b'{"error":')
+
+        def finish_body() -> None:
+            content.feed_data(b'"Demo account."}')
+            content.feed_eof()
+
+        loop.call_soon(finish_body)
+
+        body = await _read_error_body(SimpleNamespace(content=content))
+        assert body == '{"error":"Demo account."}', "The whole body should be read"
+
+    async def test_get_translations(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+    ) -> None:
+        """Test that get_translations() returns a language dict.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+
+        """
+        mock_api.get(
+            API_URL + "i18n/en",
+            body=load_fixture("get_translations.json", DOMAIN),
+        )
+
+        lang: dict = await token_tech.get_translations("en")
+        assert lang["status"] == "success", "We should receive status == success"
+        assert isinstance(
+            lang["data"], dict
+        ), "The data returned should be a dictionary"
+
+    async def test_get_translations_unsupported_language(
+        self,
+        token_tech: Tech,
+        mock_api: aioresponses,
+    ) -> None:
+        """Test that get_translations() falls back to English for other languages.
+
+        Args:
+            token_tech (Tech): Pytest fixture with a token authenticated Tech instance.
+            mock_api (aioresponses): Pytest fixture mocking the API responses.
+
+        """
+        mock_api.get(
+            API_URL + "i18n/en",
+            body=load_fixture("get_translations.json", DOMAIN),
+        )
+
+        lang: dict = await token_tech.get_translations("xyz")
+        assert lang["status"] == "success", "We should receive status == success"
+
+    @pytest.mark.parametrize(
+        ("method", "args", "expected_body"),
+        [
+            ("set_const_temp", (MODULE_UDID, ZONE_ID, 22.5), EXPECTED_CONST_TEMP),
+            ("set_zone", (MODULE_UDID, ZONE_ID, True), EXPECTED_ZONE_ON),
+            ("set_zone", (MODULE_UDID, ZONE_ID, False), EXPECTED_ZONE_OFF),
+        ],
+    )
+    async def test_set_mock(
+        self,
+        primed_tech: Tech,
+        mock_tech_post: AsyncMock,
+        mock_set_const_temp_response: dict,
+        method: str,
+        args: tuple,
+        expected_body: bytes,
+    ) -> None:
+        """Test that the zone setters send correct data and return the response.
+
+        Args:
+            primed_tech (Tech): Pytest fixture with a Tech instance primed for mocks.
+            mock_tech_post (AsyncMock): Pytest fixture with the patched Tech.post.
+            mock_set_const_temp_response (dict): Pytest fixture with the API response.
+            method (str): Name of the Tech method under test.
+            args (tuple): Arguments the method is called with.
+            expected_body (bytes): The request body the method should send.
+
+        """
+        result = await getattr(primed_tech, method)(*args)
+
+        mock_tech_post.assert_awaited_once()
+        assert mock_tech_post.call_args[0][0] == ZONES_PATH
+        assert mock_tech_post.call_args[0][1] == expected_body
+
+        # Verify that the method returns the response
+        assert result == mock_set_const_temp_response
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            (Tech.list_modules, ()),
+            (Tech.get_module_data, (MODULE_UDID,)),
+            (Tech.get_translations, ("en",)),
+            (Tech.set_const_temp, (MODULE_UDID, ZONE_ID, 22.5)),
+            (Tech.set_zone, (MODULE_UDID, ZONE_ID, True)),
+        ],
+        ids=lambda value: getattr(value, "__name__", None),
+    )
+    async def test_requires_auth(self, tech: Tech, method, args: tuple) -> None:
+        """Test that API calls raise TechError when not authenticated.
+
+        Args:
+            tech (Tech): Pytest fixture with an unauthenticated Tech instance.
+            method: The Tech method under test.
+            args (tuple): Arguments the method is called with.
+
+        """
+        with pytest.raises(TechError) as exception_info:
+            await method(tech, *args)
+        exception: TechError = exception_info.value
+        assert exception.status_code == 401, "Unexpected status code"
+        assert exception.status == "Unauthorized", "Unexpected error message"